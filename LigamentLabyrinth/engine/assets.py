@@ -7,6 +7,10 @@ import numpy as np
 
 from settings import settings
 
+# Finds the ID specifically at the end of the filename (e.g., "wall_1.png")
+# This prevents matching "512" in "wall_512x512_1.png"
+_TEXTURE_ID_PATTERN = re.compile(r'(\d+)\.[a-zA-Z0-9]+$')
+
 
 class AssetManager:
     """Manages loading and caching of game textures and assets."""
@@ -16,14 +20,39 @@ class AssetManager:
         self.textures: dict[int, pygame.Surface] = {}
         self.sprite_textures: dict[int, pygame.Surface] = {}
         
+        # Pre-downscaled copies of each sprite (full size first, halving each level)
+        self.sprite_mipmaps: dict[int, list[pygame.Surface]] = {}
+        
         self.floor_textures: dict[int, np.ndarray] = {}
         self.ceiling_textures: dict[int, np.ndarray] = {}
         
-        self.tex_width: int = settings.assets.texture_size
-        self.tex_height: int = settings.assets.texture_size
+        # The render kernels wrap texture coordinates with a bitmask, so every
+        # texture is normalised to a power-of-two size (rounding the setting up)
+        self.texture_size: int = 1 << (settings.assets.texture_size - 1).bit_length()
+        
+        self.tex_width: int = self.texture_size
+        self.tex_height: int = self.texture_size
         
         self._load_all_textures()
         self._convert_textures_to_arrays()
+        self._build_sprite_mipmaps()
+    
+    @staticmethod
+    def _generate_checkerboard_array(
+        size: int,
+        color1: tuple[int, int, int],
+        color2: tuple[int, int, int]
+    ) -> np.ndarray:
+        """Generate a 2x2 checkerboard as a (size, size, 3) uint8 array.
+        
+        Quadrants are filled with slice assignments, indexed [x, y] like surfarray.
+        """
+        half = size // 2
+        arr = np.empty((size, size, 3), dtype=np.uint8)
+        arr[:] = color1
+        arr[:half, :half] = color2
+        arr[half:, half:] = color2
+        return arr
     
     def _generate_checkerboard_texture(
         self,
@@ -32,11 +61,9 @@ class AssetManager:
         color2: tuple[int, int, int]
     ) -> pygame.Surface:
         """Generate a simple checkerboard pattern texture."""
-        surface = pygame.Surface((size, size))
-        surface.fill(color1)
-        pygame.draw.rect(surface, color2, (0, 0, size // 2, size // 2))
-        pygame.draw.rect(surface, color2, (size // 2, size // 2, size // 2, size // 2))
-        return surface
+        return pygame.surfarray.make_surface(
+            self._generate_checkerboard_array(size, color1, color2)
+        )
     
     def _ensure_power_of_two_size(self, surface: pygame.Surface, target_size: int) -> pygame.Surface:
         """Ensure texture is power-of-2 size for optimal Numba performance."""
@@ -48,22 +75,19 @@ class AssetManager:
     def _load_textures_from_directory(self) -> None:
         """Load all textures from the texture directory."""
         texture_dir = settings.assets.texture_directory
-        texture_size = settings.assets.texture_size
+        texture_size = self.texture_size
         
         if not os.path.exists(texture_dir):
             print(f"Warning: Texture directory '{texture_dir}' not found.")
             return
         
-        # Regex to find the ID specifically at the end of the filename (e.g., "wall_1.png")
-        # This prevents matching "512" in "wall_512x512_1.png"
-        id_pattern = re.compile(r'(\d+)\.[a-zA-Z0-9]+$')
-
         for filename in os.listdir(texture_dir):
-            if not filename.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp')):
+            name = filename.lower()
+            if not name.endswith(('.png', '.jpg', '.jpeg', '.bmp')):
                 continue
             
             full_path = os.path.join(texture_dir, filename)
-            match = id_pattern.search(filename)
+            match = _TEXTURE_ID_PATTERN.search(filename)
             
             if not match:
                 continue
@@ -72,17 +96,18 @@ class AssetManager:
                 tex_id = int(match.group(1))
                 img = pygame.image.load(full_path)
                 
-                # Normalize texture immediately
-                if "sprite" in filename.lower():
+                # Normalize texture immediately. Floors and ceilings are copied
+                # straight into arrays, so they skip the display-format convert
+                if "sprite" in name:
                     surface = self._ensure_power_of_two_size(img.convert_alpha(), texture_size)
                     self.sprite_textures[tex_id] = surface
                 
-                elif "floor" in filename.lower():
-                    surface = self._ensure_power_of_two_size(img.convert(), texture_size)
+                elif "floor" in name:
+                    surface = self._ensure_power_of_two_size(img, texture_size)
                     self.floor_textures[tex_id] = pygame.surfarray.array3d(surface)
                     
-                elif "ceiling" in filename.lower():
-                    surface = self._ensure_power_of_two_size(img.convert(), texture_size)
+                elif "ceiling" in name:
+                    surface = self._ensure_power_of_two_size(img, texture_size)
                     self.ceiling_textures[tex_id] = pygame.surfarray.array3d(surface)
                     
                 else:
@@ -97,7 +122,7 @@ class AssetManager:
 
     def _generate_fallback_textures(self) -> None:
         """Generate fallback textures for any missing wall textures based on Settings."""
-        texture_size = settings.assets.texture_size
+        texture_size = self.texture_size
         
         # Pulls directly from the dataclass default_factory we fixed in settings.py
         for tex_id, colors in settings.assets.default_texture_colors.items():
@@ -109,27 +134,25 @@ class AssetManager:
     
     def _generate_fallback_floor_ceiling(self) -> None:
         """Generate fallback floor and ceiling textures using the ColorPalette."""
-        texture_size = settings.assets.texture_size
+        texture_size = self.texture_size
         colors = settings.colors
 
         # ID 0 uses the primary palette defined in settings
         if 0 not in self.floor_textures:
-            surf = self._generate_checkerboard_texture(
+            self.floor_textures[0] = self._generate_checkerboard_array(
                 texture_size, colors.floor_fallback_primary, colors.floor_fallback_secondary
             )
-            self.floor_textures[0] = pygame.surfarray.array3d(surf)
             print("Generated fallback floor (ID 0)")
         
         if 0 not in self.ceiling_textures:
-            surf = self._generate_checkerboard_texture(
+            self.ceiling_textures[0] = self._generate_checkerboard_array(
                 texture_size, colors.ceiling_fallback_primary, colors.ceiling_fallback_secondary
             )
-            self.ceiling_textures[0] = pygame.surfarray.array3d(surf)
             print("Generated fallback ceiling (ID 0)")
 
     def _generate_fallback_sprites(self) -> None:
         """Generate fallback sprite textures using the ColorPalette."""
-        texture_size = settings.assets.texture_size
+        texture_size = self.texture_size
         
         if 0 not in self.sprite_textures:
             sprite_surface = pygame.Surface((texture_size, texture_size), pygame.SRCALPHA)
@@ -191,13 +214,51 @@ class AssetManager:
     def get_ceiling_arrays(self) -> np.ndarray:
         return self.ceiling_texture_arrays
     
-    def get_sprite_texture(self, sprite_id: int) -> pygame.Surface | None:
-        return self.sprite_textures.get(sprite_id, self.sprite_textures.get(0))
+    def get_packed_floor_textures(self) -> np.ndarray:
+        return self.floor_texture_packed
+    
+    def get_packed_ceiling_textures(self) -> np.ndarray:
+        return self.ceiling_texture_packed
+    
+    def get_sprite_texture(self, sprite_id: int, size: int = 0) -> pygame.Surface | None:
+        """Get a sprite texture, optionally the smallest mip level still covering size.
+        
+        Scaling cost grows with the source image, so distant (small) sprites are
+        scaled from a pre-shrunk level instead of the full-size texture.
+        
+        Args:
+            sprite_id: Sprite texture ID (falls back to ID 0)
+            size: On-screen size in pixels the texture will be scaled to (0 = full size)
+        """
+        if sprite_id not in self.sprite_mipmaps:
+            sprite_id = 0
+        levels = self.sprite_mipmaps.get(sprite_id)
+        if not levels:
+            return None
+        
+        chosen = levels[0]
+        for level in levels:
+            if level.get_width() < size:
+                break
+            chosen = level
+        return chosen
+    
+    def _build_sprite_mipmaps(self, min_size: int = 16) -> None:
+        """Build a halving chain of downscaled copies for every sprite texture."""
+        for sprite_id, surface in self.sprite_textures.items():
+            levels = [surface]
+            width, height = surface.get_size()
+            while width // 2 >= min_size and height // 2 >= min_size:
+                width //= 2
+                height //= 2
+                levels.append(pygame.transform.scale(levels[-1], (width, height)))
+            self.sprite_mipmaps[sprite_id] = levels
     
     def _prepare_wall_texture_arrays(self) -> None:
         """Prepare wall textures as a single NumPy array for numba optimization."""
         if not self.textures:
             self.wall_texture_arrays = np.zeros((1, self.tex_width, self.tex_height, 3), dtype=np.uint8)
+            self.wall_texture_packed = np.zeros((1, self.tex_width, self.tex_height), dtype=np.uint32)
             self.texture_map = np.zeros(1, dtype=np.int32)
             return
         
@@ -212,8 +273,28 @@ class AssetManager:
         self.texture_map = np.zeros(num_textures, dtype=np.int32)
         
         for tex_id, texture in self.textures.items():
-            self.wall_texture_arrays[tex_id] = pygame.surfarray.array3d(texture)
+            # Copy straight from a view of the surface's pixels into the slab,
+            # without the intermediate array that array3d would allocate
+            self.wall_texture_arrays[tex_id] = pygame.surfarray.pixels3d(texture)
             self.texture_map[tex_id] = tex_id
+        
+        self.wall_texture_packed = self._pack_texels(self.wall_texture_arrays)
+    
+    @staticmethod
+    def _pack_texels(texture_arrays: np.ndarray) -> np.ndarray:
+        """Pack (..., 3) uint8 RGB texels into 0xRRGGBB uint32 words.
+        
+        Each texture column becomes one contiguous run of 32-bit words, so the
+        render kernels fetch a texel with a single load instead of three.
+        
+        Args:
+            texture_arrays: Texel array whose last axis holds the RGB channels
+            
+        Returns:
+            The packed texels, with the channel axis removed
+        """
+        channels = texture_arrays.astype(np.uint32)
+        return (channels[..., 0] << 16) | (channels[..., 1] << 8) | channels[..., 2]
     
     def _prepare_floor_ceiling_arrays(self) -> None:
         """Prepare floor and ceiling textures as NumPy arrays for numba optimization."""
@@ -234,9 +315,14 @@ class AssetManager:
 
         self.floor_texture_arrays = pack_textures(self.floor_textures)
         self.ceiling_texture_arrays = pack_textures(self.ceiling_textures)
+        self.floor_texture_packed = self._pack_texels(self.floor_texture_arrays)
+        self.ceiling_texture_packed = self._pack_texels(self.ceiling_texture_arrays)
 
     def get_wall_texture_arrays(self) -> np.ndarray:
         return self.wall_texture_arrays
     
+    def get_packed_wall_textures(self) -> np.ndarray:
+        return self.wall_texture_packed
+    
     def get_texture_map(self) -> np.ndarray:
         return self.texture_map
\ No newline at end of file
@@ -1,4 +1,3 @@
-import math
 import pygame
 
 from settings import settings
@@ -10,6 +9,8 @@ class MinimapRenderer:
     def __init__(self) -> None:
         self.minimap_cache: pygame.Surface = None
         self.minimap_cache_valid: bool = False
+        # Pre-drawn entity dot, stamped with one batched blits() call per frame
+        self.entity_marker: pygame.Surface = None
 
     def invalidate_cache(self) -> None:
         self.minimap_cache_valid = False
@@ -43,23 +44,29 @@ class MinimapRenderer:
                             color,
                             (tile_x, tile_y, minimap_scale, minimap_scale)
                         )
+            # Match the display's pixel format so the per-frame blit is a plain copy
+            self.minimap_cache = self.minimap_cache.convert()
             self.minimap_cache_valid = True
 
+        if self.entity_marker is None:
+            marker = pygame.Surface((6, 6), pygame.SRCALPHA)
+            pygame.draw.circle(marker, settings.colors.minimap_entity, (3, 3), 3)
+            self.entity_marker = marker.convert_alpha()
+
         # Blit cached static minimap
         screen.blit(self.minimap_cache, (minimap_x, minimap_y))
 
-        # Draw dynamic elements (monsters)
-        for i in range(game_map.sprite_data.shape[0]):
-            sprite_x_world = game_map.sprite_data[i, 0]
-            sprite_y_world = game_map.sprite_data[i, 1]
-            monster_x = minimap_x + sprite_x_world * minimap_scale
-            monster_y = minimap_y + sprite_y_world * minimap_scale
-            pygame.draw.circle(
-                screen,
-                settings.colors.minimap_entity,
-                (int(monster_x), int(monster_y)),
-                3
-            )
+        # Draw dynamic elements (monsters); the dot is centred on the sprite
+        marker = self.entity_marker
+        positions = game_map.sprite_data[:, :2].tolist()
+        screen.blits(
+            [
+                (marker, (int(minimap_x + x * minimap_scale) - 3,
+                          int(minimap_y + y * minimap_scale) - 3))
+                for x, y in positions
+            ],
+            doreturn=False
+        )
 
         player_x = minimap_x + player.x * minimap_scale
         player_y = minimap_y + player.y * minimap_scale
@@ -70,9 +77,9 @@ class MinimapRenderer:
             settings.minimap.player_dot_radius
         )
 
-        rad = math.radians(player.rotation)
-        end_x = player_x + math.cos(rad) * settings.minimap.direction_line_length
-        end_y = player_y + math.sin(rad) * settings.minimap.direction_line_length
+        dir_x, dir_y = player.direction
+        end_x = player_x + dir_x * settings.minimap.direction_line_length
+        end_y = player_y + dir_y * settings.minimap.direction_line_length
         pygame.draw.line(
             screen,
             settings.colors.minimap_player,
@@ -24,8 +24,8 @@ import math
 # Without this, the game would run at 1 frame per second.
 @numba.njit(
     types.Tuple((types.float64, types.int64, types.float64, types.float64, types.int64))(
-        types.float64, types.float64, types.float64,
-        types.int32[:, :], types.int64, types.int64, types.float64
+        types.float64, types.float64, types.float64, types.float64,
+        types.uint8[:, :], types.int64, types.int64, types.float64
     ),
     fastmath=True,
     cache=True
@@ -33,7 +33,8 @@ import math
 def cast_ray_numba(
     player_x: float,
     player_y: float,
-    angle_rad: float,
+    ray_dx: float,
+    ray_dy: float,
     map_grid: np.ndarray,
     map_width: int,
     map_height: int,
@@ -45,14 +46,15 @@ def cast_ray_numba(
     It uses an algorithm called DDA (Digital Differential Analysis).
     Instead of checking every 0.1 steps (which is slow), DDA checks 
     intersection points on the grid lines. It jumps from grid line to grid line.
-    """
     
-    # 1. Calculate Ray Direction
-    # We turn the angle (radians) into X and Y vector components.
-    ray_dx = math.cos(angle_rad)
-    ray_dy = math.sin(angle_rad)
+    The ray direction (ray_dx, ray_dy) is a unit vector in world space.
+    
+    map_grid is the wall grid surrounded by a one-tile solid border (tile 1),
+    so cell (map_x, map_y) is stored at map_grid[map_y + 1, map_x + 1] and the
+    walk always stops at the border without any bounds checks.
+    """
     
-    # Current position on the map
+    # 1. Current position on the map
     x = player_x
     y = player_y
     
@@ -60,6 +62,10 @@ def cast_ray_numba(
     map_x = int(x)
     map_y = int(y)
     
+    # The border only catches rays that start inside the map
+    if map_x < 0 or map_x >= map_width or map_y < 0 or map_y >= map_height:
+        return max_depth, 0, ray_dx, ray_dy, 1
+    
     # 2. Calculate Delta Distances
     # "If I move 1 unit along the ray, how many X units or Y units did I cross?"
     # This helps us scale the steps to hit the next grid line perfectly.
@@ -96,13 +102,19 @@ def cast_ray_numba(
     # 
 
     # 4. Perform DDA (The Search Loop)
-    hit = False
     hit_val = 0
     side = 0 # 0 = hit a vertical wall, 1 = hit a horizontal wall (used for shading)
-    max_iterations = 50 # Safety limit: don't look further than 50 blocks
-    iterations = 0
     
-    while not hit and iterations < max_iterations:
+    # Bound the walk analytically instead of with a fixed step count:
+    # - every step enters a new cell along X or Y, so after map_width + map_height
+    #   steps the ray has reached the solid border around the map
+    # - within max_depth the ray crosses at most max_depth * |ray_dx| + 1 vertical
+    #   and max_depth * |ray_dy| + 1 horizontal grid lines, so anything beyond that
+    #   would be clamped to max_depth anyway
+    depth_steps = int(math.ceil(max_depth * (abs(ray_dx) + abs(ray_dy)))) + 2
+    max_steps = min(map_width + map_height, depth_steps)
+    
+    for _ in range(max_steps):
         # Jump to whichever grid line is closer (X or Y)
         if side_dist_x < side_dist_y:
             side_dist_x += delta_dist_x
@@ -113,37 +125,28 @@ def cast_ray_numba(
             map_y += step_y
             side = 1 # We moved vertically, so we hit a horizontal line
         
-        iterations += 1
-        
-        # Check if ray went out of bounds (outside the map)
-        if map_x < 0 or map_x >= map_width or map_y < 0 or map_y >= map_height:
-            hit = True
-            hit_val = 1 # Treat out-of-bounds as a solid wall
-        else:
-            # Check the map grid: Is there a wall here?
-            tile = map_grid[map_y, map_x]
-            if tile > 0:
-                hit = True
-                hit_val = tile
+        # Check the map grid: Is there a wall here? (the border counts as one)
+        tile = map_grid[map_y + 1, map_x + 1]
+        if tile > 0:
+            hit_val = tile
+            break
     
     # 5. Calculate Final Distance
     # This math corrects the "Fish-eye" effect. We want the perpendicular distance
     # to the camera plane, not the Euclidean distance to the player point.
+    # The last step was taken along the axis named by side, which is only
+    # possible if the ray has a non-zero component on that axis (a zero
+    # component gets an effectively infinite delta_dist above), so the
+    # divisions below cannot be by zero.
     if side == 0:
-        if ray_dx != 0:
-            distance = (map_x - x + (1 - step_x) / 2) / ray_dx
-        else:
-            distance = max_depth
+        distance = (map_x - x + (1 - step_x) / 2) / ray_dx
     else:
-        if ray_dy != 0:
-            distance = (map_y - y + (1 - step_y) / 2) / ray_dy
-        else:
-            distance = max_depth
+        distance = (map_y - y + (1 - step_y) / 2) / ray_dy
     
     distance = abs(distance)
     
     # Cap the distance to avoid rendering errors at infinite depth
-    if distance > max_depth or distance < 0:
+    if distance > max_depth:
         distance = max_depth
         
     return distance, side, ray_dx, ray_dy, hit_val
@@ -151,11 +154,12 @@ def cast_ray_numba(
 
 @numba.njit(
     types.void(
-        types.uint8[:, :, :],      # buffer_pixels
-        types.uint8[:, :, :, :],   # floor_arrays
-        types.uint8[:, :, :, :],   # ceiling_arrays
-        types.int32[:, :],         # floor_grid
-        types.int32[:, :],         # ceiling_grid
+        types.uint32[:, :],        # buffer_pixels (packed 32-bit pixels)
+        types.UniTuple(types.int64, 3),  # pixel_shifts (red, green, blue)
+        types.uint32[:, :, :],     # floor_arrays (packed 0xRRGGBB)
+        types.uint32[:, :, :],     # ceiling_arrays (packed 0xRRGGBB)
+        types.uint8[:, :],         # floor_grid
+        types.uint8[:, :],         # ceiling_grid
         types.int64,               # map_width
         types.int64,               # map_height
         types.int64,               # floor_width
@@ -165,7 +169,8 @@ def cast_ray_numba(
         types.int64,               # screen_height
         types.float64,             # player_x
         types.float64,             # player_y
-        types.float64,             # player_rotation_rad
+        types.float64,             # player_dir_x
+        types.float64,             # player_dir_y
         types.float64,             # fov_rad
         types.float64,             # bob_offset_y
         types.float64,             # wall_height_factor
@@ -173,9 +178,10 @@ def cast_ray_numba(
         types.float64,             # light_intensity
         types.float64,             # ambient_light
         types.boolean,             # enable_vignette
-        types.float64,             # vignette_intensity
-        types.float64,             # vignette_radius
-        types.float64              # glitch_intensity
+        types.float32[:, :],       # vignette_map
+        types.float64,             # glitch_intensity
+        types.int64[:],            # occluded_top
+        types.int64[:]             # occluded_bottom
     ),
     fastmath=True,
     parallel=True, # Uses multiple CPU cores
@@ -183,6 +189,7 @@ def cast_ray_numba(
 )
 def render_floor_ceiling_numba(
     buffer_pixels: np.ndarray,
+    pixel_shifts: tuple,
     floor_arrays: np.ndarray,
     ceiling_arrays: np.ndarray,
     floor_grid: np.ndarray,
@@ -196,7 +203,8 @@ def render_floor_ceiling_numba(
     screen_height: int,
     player_x: float,
     player_y: float,
-    player_rotation_rad: float,
+    player_dir_x: float,
+    player_dir_y: float,
     fov_rad: float,
     bob_offset_y: float,
     wall_height_factor: float,
@@ -204,9 +212,10 @@ def render_floor_ceiling_numba(
     light_intensity: float,
     ambient_light: float,
     enable_vignette: bool,
-    vignette_intensity: float,
-    vignette_radius: float,
-    glitch_intensity: float
+    vignette_map: np.ndarray,
+    glitch_intensity: float,
+    occluded_top: np.ndarray,
+    occluded_bottom: np.ndarray
 ) -> None:
     """
     Renders the floor and ceiling.
@@ -220,8 +229,14 @@ def render_floor_ceiling_numba(
     Horizon    ----------------- (Horizon line, infinite distance)
                  ...
     Screen Bot ----------------- (Floor at your feet, distance 0)
+    
+    Pixels whose screen rows lie inside [occluded_top[x], occluded_bottom[x])
+    are skipped, since the wall pass draws over them anyway.
     """
     
+    # Pixels are written as packed integers in the screen's own channel layout
+    red_shift, green_shift, blue_shift = pixel_shifts
+    
     # 1. Setup Frustum (The "Camera Triangle")
     half_fov_rad = fov_rad / 2.0
     tan_half_fov = math.tan(half_fov_rad)
@@ -240,9 +255,9 @@ def render_floor_ceiling_numba(
     floor_tex_mask = floor_tex_width - 1
     ceiling_tex_mask = ceiling_tex_width - 1
     
-    # Pre-calculate player direction vectors
-    player_cos = math.cos(player_rotation_rad)
-    player_sin = math.sin(player_rotation_rad)
+    # Player direction vector (cos, sin of the rotation), precomputed by the caller
+    player_cos = player_dir_x
+    player_sin = player_dir_y
     
     # Calculate the left and right edges of the camera plane
     plane_x = -player_sin * tan_half_fov * aspect_ratio
@@ -252,21 +267,47 @@ def render_floor_ceiling_numba(
     pos_z = 0.5 * screen_height * wall_height_factor
     epsilon = 1.0
     
-    # Constants for the "Vignette" (dark corners effect)
-    vignette_radius_squared = vignette_radius * vignette_radius
-    vignette_denominator = 1.414 - vignette_radius + 0.001
+    # Direction of the rays through the left screen edge, and the change per
+    # buffer column (screen_x_norm = 2 * x / floor_width - 1 below)
+    left_dir_x = player_cos - plane_x
+    left_dir_y = player_sin - plane_y
+    column_dir_step_x = 2.0 * plane_x / floor_width
+    column_dir_step_y = 2.0 * plane_y / floor_width
+    
+    # The glitch is constant for the frame
+    corruption_multiplier = 1.0 - glitch_intensity
     
     # 2. Iterate over Rows (Parallelized for speed)
     # y represents the vertical coordinate on the screen
     for y in numba.prange(floor_height):
         screen_y = y * floor_scale
+        # Last row of buffer pixels is also stretched over any remainder rows
+        screen_y_end = screen_height if y == floor_height - 1 else screen_y + floor_scale
         
         # p is the position relative to the center of the screen (horizon)
         p = screen_y - screen_half
         
-        # Avoid division by zero at the exact horizon line
-        if abs(p) < epsilon:
-            p = epsilon if p >= 0 else -epsilon
+        # Rows this close to the horizon are never drawn
+        if abs(p) <= epsilon:
+            continue
+        
+        # Floor and ceiling are one pass: every pixel of a row lies on the same
+        # surface, so pick the textures and tile grid once per row (bottom half
+        # = floor, top half = ceiling) instead of branching per pixel
+        if p > 0:
+            surface_arrays = floor_arrays
+            surface_grid = floor_grid
+            num_surface_textures = num_floor_textures
+            tex_width = floor_tex_width
+            tex_height = floor_tex_height
+            tex_mask = floor_tex_mask
+        else:
+            surface_arrays = ceiling_arrays
+            surface_grid = ceiling_grid
+            num_surface_textures = num_ceiling_textures
+            tex_width = ceiling_tex_width
+            tex_height = ceiling_tex_height
+            tex_mask = ceiling_tex_mask
         
         # MAGIC MATH: Calculate how far away this screen row is in the 3D world.
         # Pixels closer to the center of the screen are far away (high row_distance).
@@ -280,38 +321,36 @@ def render_floor_ceiling_numba(
         else:
             distance_factor = 1.0
         
+        row_lighting = distance_factor * corruption_multiplier
+        
+        # World position under the left-most pixel, and the step per buffer column:
+        # world coordinates are linear across a row, so no per-pixel ray setup
+        row_start_x = player_x + left_dir_x * row_distance
+        row_start_y = player_y + left_dir_y * row_distance
+        row_step_x = column_dir_step_x * row_distance
+        row_step_y = column_dir_step_y * row_distance
+        
         # 3. Iterate over Columns (pixels in the row)
         for x in range(floor_width):
-            screen_x = x * floor_scale
+            # Hidden behind a wall strip: don't shade a pixel that gets overwritten
+            if screen_y >= occluded_top[x] and screen_y_end <= occluded_bottom[x]:
+                continue
             
-            # Map screen X (-1 to 1) to world coordinates
-            screen_x_norm = (2.0 * x / floor_width) - 1.0
-            ray_dir_x = player_cos + plane_x * screen_x_norm
-            ray_dir_y = player_sin + plane_y * screen_x_norm
+            screen_x = x * floor_scale
             
-            # This is the exact spot on the floor map this pixel represents
-            world_x = player_x + ray_dir_x * row_distance
-            world_y = player_y + ray_dir_y * row_distance
+            # This is the exact spot on the floor/ceiling map this pixel represents
+            world_x = row_start_x + x * row_step_x
+            world_y = row_start_y + x * row_step_y
             
             # --- VIGNETTE & GLITCH EFFECTS ---
+            # The darkening only depends on the screen position, so it is read
+            # from the table precomputed once by the Raycaster
             vignette_multiplier = 1.0
             if enable_vignette:
-                # Calculate distance from center of screen for darkness
-                x_norm = (screen_x - screen_width / 2.0) / (screen_width / 2.0)
-                y_norm = (screen_y - screen_height / 2.0) / (screen_height / 2.0)
-                screen_dist_squared = x_norm * x_norm + y_norm * y_norm
-                
-                if screen_dist_squared > vignette_radius_squared:
-                    screen_dist = math.sqrt(screen_dist_squared)
-                    vignette_falloff = (screen_dist - vignette_radius) / vignette_denominator
-                    vignette_falloff = min(1.0, vignette_falloff)
-                    vignette_multiplier = 1.0 - (vignette_falloff * vignette_intensity)
-            
-            base_lighting = distance_factor * vignette_multiplier
+                vignette_multiplier = vignette_map[screen_x, screen_y]
             
             # The "Glitch" makes colors weird by multiplying them negatively
-            corruption_multiplier = 1.0 - glitch_intensity
-            final_lighting = base_lighting * corruption_multiplier
+            final_lighting = row_lighting * vignette_multiplier
             
             # --- TEXTURE MAPPING ---
             map_x = int(world_x)
@@ -323,67 +362,134 @@ def render_floor_ceiling_numba(
             if map_y < 0: map_y = 0
             if map_y >= map_height: map_y = map_height - 1
             
-            # Decide if we are drawing Floor (bottom half) or Ceiling (top half)
-            if p > epsilon:
-                # --- FLOOR ---
-                floor_tex_id = floor_grid[map_y, map_x]
-                if floor_tex_id >= num_floor_textures: floor_tex_id = 0
-                
-                # Get the pixel from the texture image
-                tex_x = int(world_x * floor_tex_width) & floor_tex_mask
-                tex_y = int(world_y * floor_tex_height) & floor_tex_mask
-                
-                # Apply color and lighting
-                # The % 256 is vital for the glitch effect to "wrap around" colors
-                r = int(floor_arrays[floor_tex_id, tex_x, tex_y, 0] * final_lighting) % 256
-                g = int(floor_arrays[floor_tex_id, tex_x, tex_y, 1] * final_lighting) % 256
-                b = int(floor_arrays[floor_tex_id, tex_x, tex_y, 2] * final_lighting) % 256
-                
-                # Fix negative numbers if glitch caused them
-                r = (r + 256) % 256
-                g = (g + 256) % 256
-                b = (b + 256) % 256
-                
-                buffer_pixels[x, y, 0] = r
-                buffer_pixels[x, y, 1] = g
-                buffer_pixels[x, y, 2] = b
+            tex_id = surface_grid[map_y, map_x]
+            if tex_id >= num_surface_textures: tex_id = 0
             
-            elif p < -epsilon:
-                # --- CEILING ---
-                # (Logic is identical to floor, just using ceiling arrays)
-                ceiling_tex_id = ceiling_grid[map_y, map_x]
-                if ceiling_tex_id >= num_ceiling_textures: ceiling_tex_id = 0
-                
-                tex_x = int(world_x * ceiling_tex_width) & ceiling_tex_mask
-                tex_y = int(world_y * ceiling_tex_height) & ceiling_tex_mask
-                
-                r = int(ceiling_arrays[ceiling_tex_id, tex_x, tex_y, 0] * final_lighting) % 256
-                g = int(ceiling_arrays[ceiling_tex_id, tex_x, tex_y, 1] * final_lighting) % 256
-                b = int(ceiling_arrays[ceiling_tex_id, tex_x, tex_y, 2] * final_lighting) % 256
-                
-                r = (r + 256) % 256
-                g = (g + 256) % 256
-                b = (b + 256) % 256
-                
-                buffer_pixels[x, y, 0] = r
-                buffer_pixels[x, y, 1] = g
-                buffer_pixels[x, y, 2] = b
+            # Get the pixel from the texture image
+            tex_x = int(world_x * tex_width) & tex_mask
+            tex_y = int(world_y * tex_height) & tex_mask
+            
+            # Get RGB colors (one 32-bit load per texel)
+            texel = surface_arrays[tex_id, tex_x, tex_y]
+            
+            # Apply color and lighting
+            # Masking to the low byte is vital for the glitch effect to "wrap around"
+            # colors; it is a single AND and also maps negative values into 0..255
+            r = int(((texel >> 16) & 0xFF) * final_lighting) & 0xFF
+            g = int(((texel >> 8) & 0xFF) * final_lighting) & 0xFF
+            b = int((texel & 0xFF) * final_lighting) & 0xFF
+            
+            buffer_pixels[x, y] = (r << red_shift) | (g << green_shift) | (b << blue_shift)
 
 
 @numba.njit(
-types.void(
-        types.uint8[:, :, :],      # screen_pixels
-        types.uint8[:, :, :, :],   # texture_arrays
-        types.int32[:],            # texture_map
+    types.void(
         types.float64,             # player_x
         types.float64,             # player_y
-        types.float64,             # player_rotation_deg
-        types.int32[:, :],         # map_grid
+        types.float64,             # player_cos
+        types.float64,             # player_sin
+        types.uint8[:, :],         # map_grid
         types.int64,               # map_width
         types.int64,               # map_height
+        types.float64,             # max_depth
+        types.int64,               # num_rays
+        types.float64[:],          # ray_cos_offsets
+        types.float64[:],          # ray_sin_offsets
+        types.float64[:],          # ray_distances (output)
+        types.float64[:],          # ray_wall_x (output)
+        types.uint8[:],            # ray_flip (output)
+        types.int32[:]             # ray_hit_vals (output)
+    ),
+    fastmath=True,
+    parallel=True,
+    cache=True
+)
+def cast_rays_numba(
+    player_x: float,
+    player_y: float,
+    player_cos: float,
+    player_sin: float,
+    map_grid: np.ndarray,
+    map_width: int,
+    map_height: int,
+    max_depth: float,
+    num_rays: int,
+    ray_cos_offsets: np.ndarray,
+    ray_sin_offsets: np.ndarray,
+    ray_distances: np.ndarray,
+    ray_wall_x: np.ndarray,
+    ray_flip: np.ndarray,
+    ray_hit_vals: np.ndarray
+) -> None:
+    """
+    Casts ALL rays of the frame in one batch.
+    
+    Every screen column gets one ray. The results are written into per-ray
+    arrays, so the wall drawing (and anything else that needs to know where
+    the walls are) can work from them without casting again.
+    
+    Each ray's angle offset from the view direction is fixed by the screen
+    geometry, so its cos/sin are precomputed once (ray_cos_offsets and
+    ray_sin_offsets). Per frame we only rotate them by the player's heading,
+    which needs no trig at all inside the loop.
+    """
+    
+    # LOOP: One ray per vertical strip of the screen
+    for ray_index in numba.prange(num_rays):
+        
+        # 1. Calculate the Ray Direction
+        # Rotate the fixed per-ray offset by the player's heading:
+        # (cos(a + b), sin(a + b)) from the angle-sum identities
+        cos_offset = ray_cos_offsets[ray_index]
+        sin_offset = ray_sin_offsets[ray_index]
+        ray_dx = player_cos * cos_offset - player_sin * sin_offset
+        ray_dy = player_sin * cos_offset + player_cos * sin_offset
+        
+        # 2. Cast the Ray (Find the wall)
+        distance, side, ray_dx, ray_dy, hit_val = cast_ray_numba(
+            player_x, player_y, ray_dx, ray_dy,
+            map_grid, map_width, map_height, max_depth
+        )
+        
+        # 3. Calculate where exactly on the wall block we hit (0.0 to 1.0).
+        # This uses the raw (Euclidean) distance along the ray.
+        if side == 0:
+            wall_x = player_y + distance * ray_dy
+        else:
+            wall_x = player_x + distance * ray_dx
+        
+        # Keep only the decimal part. The hit point lies inside the map, so wall_x
+        # is never negative and a plain truncating int cast equals floor()
+        wall_x -= int(wall_x)
+        
+        # Flip texture if hitting the "back" side of a block so it doesn't look mirrored
+        flip = (side == 0 and ray_dx > 0) or (side == 1 and ray_dy < 0)
+        
+        # 4. Fix Fish-Eye Effect
+        # If we use raw distance, straight walls look curved. We must multiply
+        # by cos(angle_offset) to flatten the view.
+        distance *= cos_offset
+        
+        if distance < 0.01: distance = 0.01 # Prevent divide by zero
+        
+        ray_distances[ray_index] = distance
+        ray_wall_x[ray_index] = wall_x
+        ray_flip[ray_index] = 1 if flip else 0
+        ray_hit_vals[ray_index] = hit_val
+
+
+@numba.njit(
+types.void(
+        types.uint32[:, :],        # screen_pixels (packed 32-bit pixels)
+        types.UniTuple(types.int64, 3),  # pixel_shifts (red, green, blue)
+        types.uint32[:, :, :],     # texture_arrays (packed 0xRRGGBB)
+        types.int32[:],            # texture_map
+        types.float64[:],          # ray_distances
+        types.float64[:],          # ray_wall_x
+        types.uint8[:],            # ray_flip
+        types.int32[:],            # ray_hit_vals
         types.int64,               # screen_width
         types.int64,               # screen_height
-        types.float64,             # fov
         types.float64,             # max_depth
         types.int64,               # num_rays
         types.float64,             # ray_width
@@ -393,8 +499,7 @@ types.void(
         types.float64,             # light_intensity
         types.float64,             # ambient_light
         types.boolean,             # enable_vignette
-        types.float64,             # vignette_intensity
-        types.float64,             # vignette_radius
+        types.float32[:, :],       # vignette_map
         types.float64,             # glitch_intensity
         types.float32[:]           # depth_buffer (passed in, modified in-place)
     ),
@@ -404,17 +509,15 @@ types.void(
 )
 def render_walls_numba(
     screen_pixels: np.ndarray,
+    pixel_shifts: tuple,
     texture_arrays: np.ndarray,
     texture_map: np.ndarray,
-    player_x: float,
-    player_y: float,
-    player_rotation_deg: float,
-    map_grid: np.ndarray,
-    map_width: int,
-    map_height: int,
+    ray_distances: np.ndarray,
+    ray_wall_x: np.ndarray,
+    ray_flip: np.ndarray,
+    ray_hit_vals: np.ndarray,
     screen_width: int,
     screen_height: int,
-    fov: float,
     max_depth: float,
     num_rays: int,
     ray_width: float,
@@ -424,8 +527,7 @@ def render_walls_numba(
     light_intensity: float,
     ambient_light: float,
     enable_vignette: bool,
-    vignette_intensity: float,
-    vignette_radius: float,
+    vignette_map: np.ndarray,
     glitch_intensity: float,
     depth_buffer: np.ndarray
 ) -> None:
@@ -433,94 +535,55 @@ def render_walls_numba(
     Renders the vertical wall strips.
     
     This is the core of the 3D effect. We sweep across the screen from left to right.
-    For every vertical column of pixels:
-    1. Cast a ray at that angle.
-    2. See how far away the wall is.
-    3. Draw a vertical line of pixels.
+    For every vertical column of pixels (rays were already cast by cast_rays_numba):
+    1. Look up how far away the wall is.
+    2. Draw a vertical line of pixels.
        - Close wall = Long line (looks big).
        - Far wall = Short line (looks small).
     """
     
-    half_fov_rad = math.radians(fov / 2.0)
-    tan_half_fov = math.tan(half_fov_rad)
-    aspect_ratio = screen_width / screen_height
+    red_shift, green_shift, blue_shift = pixel_shifts
+    
     screen_half = screen_height / 2.0 + bob_offset_y
     
     tex_width = texture_arrays.shape[1]
     tex_height = texture_arrays.shape[2]
     tex_mask = tex_width - 1
     
-    # Precompute vignette constants
-    vignette_radius_squared = vignette_radius * vignette_radius
-    vignette_denominator = 1.414 - vignette_radius + 0.001 
-    
     # Clear the depth buffer (reset distance to infinity for new frame)
     # The depth buffer remembers how far away the wall is at every pixel column.
     # We need this later so sprites don't draw ON TOP of walls they should be behind.
     depth_buffer[:] = max_depth
     
-    # 
-
     # LOOP: Process every vertical strip (ray) of the screen
     for ray_index in numba.prange(num_rays):
         
-        # 1. Calculate the Ray Angle
-        # Map ray_index (0 to screen_width) to -1 to 1
-        screen_x = (2.0 * ray_index) / num_rays - 1.0
-        
-        # Calculate angle offset from the player's center view
-        angle_offset_rad = math.atan(screen_x * tan_half_fov * aspect_ratio)
-        angle_offset_deg = math.degrees(angle_offset_rad)
+        distance = ray_distances[ray_index]
+        hit_val = ray_hit_vals[ray_index]
         
-        ray_angle_deg = player_rotation_deg + angle_offset_deg
-        ray_angle_rad = math.radians(ray_angle_deg)
-        
-        # 2. Cast the Ray (Find the wall)
-        distance, side, ray_dx, ray_dy, hit_val = cast_ray_numba(
-            player_x, player_y, ray_angle_rad,
-            map_grid, map_width, map_height, max_depth
-        )
-        
-        # 3. Fix Fish-Eye Effect
-        # If we use raw distance, straight walls look curved. We must multiply
-        # by cos(angle_offset) to flatten the view.
-        raw_distance = distance
-        distance *= math.cos(angle_offset_rad)
-        
-        if distance < 0.01: distance = 0.01 # Prevent divide by zero
-        
-        # 4. Calculate Wall Dimensions
+        # 1. Calculate Wall Dimensions
         # Height is inversely proportional to distance (1/distance)
         wall_height = int((screen_height * wall_height_factor) / distance)
         
         # Find where the wall starts on screen (centered vertically)
         wall_top = int(screen_half - (wall_height / 2.0))
         
-        # 5. Calculate Texture X Coordinate
-        # We need to know exactly WHERE on the wall block we hit (0.0 to 1.0)
-        # to know which column of the texture image to draw.
-        if side == 0:
-            wall_x = player_y + raw_distance * ray_dy
-        else:
-            wall_x = player_x + raw_distance * ray_dx
-        
-        wall_x -= math.floor(wall_x) # Keep only the decimal part
-        tex_x = int(wall_x * tex_width)
+        # 2. Calculate Texture X Coordinate
+        # wall_x says exactly WHERE on the wall block the ray hit (0.0 to 1.0),
+        # which tells us which column of the texture image to draw.
+        # Textures are power-of-two sized, so a mask keeps the column in range
+        tex_x = int(ray_wall_x[ray_index] * tex_width) & tex_mask
         
         # Flip texture if hitting the "back" side of a block so it doesn't look mirrored
-        if side == 0 and ray_dx > 0:
-            tex_x = tex_width - tex_x - 1
-        if side == 1 and ray_dy < 0:
-            tex_x = tex_width - tex_x - 1
-        
-        tex_x = max(0, min(tex_x, tex_width - 1))
+        if ray_flip[ray_index]:
+            tex_x = tex_mask - tex_x
         
         # Look up which texture image to use
         texture_idx = 0
         if hit_val < len(texture_map):
             texture_idx = int(texture_map[hit_val])
         
-        # 6. Lighting Calculation
+        # 3. Lighting Calculation
         lighting_multiplier = 1.0
         if enable_inverse_square:
             distance_factor = light_intensity / (distance * distance + 0.1)
@@ -535,58 +598,63 @@ def render_walls_numba(
         x_end = int((ray_index + 1) * ray_width)
         x_end = min(x_end, screen_width)
         
-        # 7. Draw the Wall Strip
+        # Glitch is constant for the frame, so fold it into the column lighting
+        column_lighting = lighting_multiplier * (1.0 - glitch_intensity)
+        
+        # 4. Draw the Wall Strip
         if wall_height > 0 and wall_height < 8000:
+            # Every pixel of this strip samples the same texture column, and each
+            # screen row down the strip advances a constant step through it.
+            # The step is kept in 16.16 fixed point so walking down the strip
+            # is an integer add and shift instead of a float multiply + convert.
+            tex_column = texture_arrays[texture_idx, tex_x]
+            tex_step_fixed = ((tex_height << 16) + wall_height // 2) // wall_height
+            tex_y_max = tex_height - 1
+            y_start = max(0, wall_top)
+            y_end = min(screen_height, wall_top + wall_height)
+            
             for screen_x_pos in range(x_start, x_end):
                 
                 # Write to Depth Buffer (Vital for Sprites later!)
                 depth_buffer[screen_x_pos] = distance
                 
+                # Screen columns are contiguous in the (W, H) buffers, so the
+                # strip loop below is a straight run of loads and 32-bit stores
+                # the compiler can unroll and vectorise (no data-dependent branches)
+                column_pixels = screen_pixels[screen_x_pos]
+                column_vignette = vignette_map[screen_x_pos]
+                
+                tex_pos = (y_start - wall_top) * tex_step_fixed
+                
                 # Iterate down the vertical line
-                for screen_y_pos in range(max(0, wall_top), min(screen_height, wall_top + wall_height)):
+                for screen_y_pos in range(y_start, y_end):
                     
                     # --- Vignette Calculation ---
-                    vignette_multiplier = 1.0
-                    if enable_vignette:
-                        x_norm = (screen_x_pos - screen_width / 2.0) / (screen_width / 2.0)
-                        y_norm = (screen_y_pos - screen_height / 2.0) / (screen_height / 2.0)
-                        screen_dist_squared = x_norm * x_norm + y_norm * y_norm
-                        
-                        if screen_dist_squared > vignette_radius_squared:
-                            screen_dist = math.sqrt(screen_dist_squared)
-                            vignette_falloff = (screen_dist - vignette_radius) / vignette_denominator
-                            vignette_falloff = min(1.0, vignette_falloff)
-                            vignette_multiplier = 1.0 - (vignette_falloff * vignette_intensity)
+                    vignette_multiplier = column_vignette[screen_y_pos] if enable_vignette else 1.0
                     
                     # Combine Lighting + Glitch
-                    base_lighting = lighting_multiplier * vignette_multiplier
-                    corruption_multiplier = 1.0 - glitch_intensity
-                    final_lighting = base_lighting * corruption_multiplier
+                    final_lighting = column_lighting * vignette_multiplier
                     
                     # --- Texture Sampling ---
-                    # Map screen Y to Texture Y
-                    y_ratio = (screen_y_pos - wall_top) / wall_height
-                    tex_y = int(y_ratio * tex_height)
-                    tex_y = max(0, min(tex_y, tex_height - 1))
+                    # Map screen Y to Texture Y (nearest neighbour, no per-pixel divide)
+                    tex_y = min(tex_pos >> 16, tex_y_max)
+                    tex_pos += tex_step_fixed
                     
-                    # Get RGB colors
-                    r = texture_arrays[texture_idx, tex_x, tex_y, 0]
-                    g = texture_arrays[texture_idx, tex_x, tex_y, 1]
-                    b = texture_arrays[texture_idx, tex_x, tex_y, 2]
+                    # Get RGB colors (one 32-bit load per texel)
+                    texel = tex_column[tex_y]
+                    r = (texel >> 16) & 0xFF
+                    g = (texel >> 8) & 0xFF
+                    b = texel & 0xFF
                     
                     # Apply final lighting and write to screen buffer
-                    r_lit = int(r * final_lighting) % 256
-                    g_lit = int(g * final_lighting) % 256
-                    b_lit = int(b * final_lighting) % 256
-                    
-                    r_lit = (r_lit + 256) % 256
-                    g_lit = (g_lit + 256) % 256
-                    b_lit = (b_lit + 256) % 256
+                    r_lit = int(r * final_lighting) & 0xFF
+                    g_lit = int(g * final_lighting) & 0xFF
+                    b_lit = int(b * final_lighting) & 0xFF
                     
-                    screen_pixels[screen_x_pos, screen_y_pos, 0] = r_lit
-                    screen_pixels[screen_x_pos, screen_y_pos, 1] = g_lit
-                    screen_pixels[screen_x_pos, screen_y_pos, 2] = b_lit
-
+                    # One packed 32-bit store per pixel instead of three byte stores
+                    column_pixels[screen_y_pos] = (
+                        (r_lit << red_shift) | (g_lit << green_shift) | (b_lit << blue_shift)
+                    )
 
 @numba.njit(
     types.float32[:, :](
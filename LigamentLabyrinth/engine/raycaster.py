@@ -3,14 +3,16 @@
 import math
 import pygame
 import numpy as np
+from collections import OrderedDict
 
 from settings import settings
 from engine.assets import AssetManager
-from world.player import Player
+from world.player import Player, DEG_TO_RAD
 from world.map import Map
 from typing import TYPE_CHECKING
 from engine.numba_kernels import (
     render_floor_ceiling_numba, 
+    cast_rays_numba,
     render_walls_numba,
     process_sprites_numba
 )
@@ -35,6 +37,7 @@ class Raycaster:
         self.asset_manager: AssetManager = asset_manager
         
         self.fov: float = settings.render.fov
+        self.fov_rad: float = self.fov * DEG_TO_RAD
         self.max_depth: float = settings.render.max_depth
         
         self.num_rays: int = screen_width // settings.render.wall_ray_resolution_divisor
@@ -44,8 +47,49 @@ class Raycaster:
         self.floor_width: int = screen_width // self.floor_scale
         self.floor_height: int = screen_height // self.floor_scale
         
-        # Cache floor/ceiling buffer to avoid recreating every frame
-        self.floor_ceiling_buffer: pygame.Surface = pygame.Surface((self.floor_width, self.floor_height))
+        # Persistent frame buffer in surfarray layout (W, H) holding packed 32-bit
+        # pixels; floors, ceilings and walls are all written here and pushed to the
+        # screen with one blit_array, which for packed pixels is a plain copy
+        self.frame_buffer: np.ndarray = np.zeros((screen_width, screen_height), dtype=np.uint32)
+        
+        # Floor/ceiling target: the frame buffer itself at full resolution,
+        # otherwise a low-res buffer that is upscaled into the frame buffer
+        if self.floor_scale == 1:
+            self.floor_ceiling_buffer: np.ndarray = self.frame_buffer
+        else:
+            self.floor_ceiling_buffer = np.zeros((self.floor_width, self.floor_height), dtype=np.uint32)
+        
+        # The vignette only depends on screen position, so compute it once per
+        # pixel instead of re-deriving it (with a sqrt) every frame
+        self.vignette_map: np.ndarray = self._build_vignette_map()
+        
+        # Each ray's angle offset from the view direction depends only on the screen
+        # geometry, so its cos/sin (the cos doubles as the fish-eye correction)
+        # are computed once here instead of per ray per frame
+        self.ray_cos_offsets, self.ray_sin_offsets = self._build_ray_offset_tables()
+        
+        # Per-ray results of the batched DDA, filled by cast_rays_numba every frame
+        self.ray_distances: np.ndarray = np.empty(self.num_rays, dtype=np.float64)
+        self.ray_wall_x: np.ndarray = np.empty(self.num_rays, dtype=np.float64)
+        self.ray_flip: np.ndarray = np.empty(self.num_rays, dtype=np.uint8)
+        self.ray_hit_vals: np.ndarray = np.empty(self.num_rays, dtype=np.int32)
+        
+        # Screen rows each floor/ceiling column can skip because a wall strip will
+        # be drawn over them, filled per frame by _update_wall_spans
+        self.column_ray_index: np.ndarray = self._build_column_ray_index()
+        self.floor_column_starts: np.ndarray = np.arange(0, self.floor_width * self.floor_scale, self.floor_scale)
+        self.floor_occluded_top: np.ndarray = np.empty(self.floor_width, dtype=np.int64)
+        self.floor_occluded_bottom: np.ndarray = np.empty(self.floor_width, dtype=np.int64)
+        
+        # Scratch arrays for _update_wall_spans, reused every frame. The span
+        # arrays carry one extra, permanently empty slot for columns no strip covers.
+        self.span_scratch: np.ndarray = np.empty(self.num_rays, dtype=np.float64)
+        self.span_heights: np.ndarray = np.empty(self.num_rays, dtype=np.int64)
+        self.span_skipped: np.ndarray = np.empty(self.num_rays, dtype=np.bool_)
+        self.span_tops: np.ndarray = np.full(self.num_rays + 1, screen_height, dtype=np.int64)
+        self.span_bottoms: np.ndarray = np.zeros(self.num_rays + 1, dtype=np.int64)
+        self.column_span_tops: np.ndarray = np.empty(screen_width, dtype=np.int64)
+        self.column_span_bottoms: np.ndarray = np.empty(screen_width, dtype=np.int64)
         
         # Pre-allocate depth buffer to avoid GC thrashing (reused every frame)
         self.depth_buffer: np.ndarray = np.full(screen_width, self.max_depth, dtype=np.float32)
@@ -53,31 +97,148 @@ class Raycaster:
         # Cache darkened sprites to avoid recreating surfaces every frame
         # Key: (texture_id, width, height, quantized_light_factor)
         # Value: darkened pygame.Surface
-        self.darkened_sprite_cache: dict = {}
+        # Kept in least-recently-used order so the oldest entries are evicted once
+        # full, instead of the cache freezing and missing on every new sprite size
+        self.darkened_sprite_cache: OrderedDict = OrderedDict()
         self.max_cache_size: int = 1000
         
+        # Inputs the frame buffer was last rendered from (None = never rendered)
+        self.last_view_state: tuple | None = None
+        
+        self._warm_up_kernels()
+    
+    def _build_ray_offset_tables(self) -> tuple[np.ndarray, np.ndarray]:
+        """Precompute cos/sin of every ray's angle offset from the view direction.
+        
+        Returns:
+            Tuple of (cos_offsets, sin_offsets), each a float64 array of length num_rays
+        """
+        tan_half_fov = math.tan(self.fov_rad / 2.0)
+        aspect_ratio = self.screen_width / self.screen_height
+        
+        # Map ray index to -1..1 across the screen, then onto the camera plane
+        screen_x = (2.0 * np.arange(self.num_rays)) / self.num_rays - 1.0
+        angle_offsets = np.arctan(screen_x * tan_half_fov * aspect_ratio)
+        
+        return np.cos(angle_offsets), np.sin(angle_offsets)
+    
+    def _build_column_ray_index(self) -> np.ndarray:
+        """Map every screen column to the ray whose wall strip covers it.
+        
+        Returns:
+            int64 array of length screen_width; columns no strip covers map to
+            num_rays, an extra "no wall" slot in the per-ray span arrays
+        """
+        # Same strip bounds as render_walls_numba: int(ray_index * ray_width)
+        strip_starts = (np.arange(self.num_rays + 1) * self.ray_width).astype(np.int64)
+        columns = np.arange(self.screen_width)
+        column_ray_index = np.searchsorted(strip_starts, columns, side='right') - 1
+        column_ray_index[columns >= strip_starts[-1]] = self.num_rays
+        return column_ray_index
+    
+    def _update_wall_spans(self, bob_offset_y: float) -> None:
+        """Work out which floor/ceiling pixels the wall pass is going to cover.
+        
+        Repeats the strip height/top/clip maths of render_walls_numba for all
+        rays at once with NumPy, then reduces it to one hidden row range per
+        floor/ceiling column (the rows hidden in every screen column it spans).
+        Each range is trimmed by a row at both ends so rounding differences
+        between the two computations can never leave a pixel unpainted.
+        
+        Args:
+            bob_offset_y: Vertical view bobbing offset of the player
+        """
+        screen_half = self.screen_height / 2.0 + bob_offset_y
+        scratch = self.span_scratch
+        wall_heights = self.span_heights
+        # Views over the real rays; the trailing "no wall" slot is never written
+        span_tops = self.span_tops[:-1]
+        span_bottoms = self.span_bottoms[:-1]
+        
+        # Assigning floats into the int64 arrays truncates, like int() in the kernel
+        np.divide(self.screen_height * settings.render.wall_height_factor, self.ray_distances, out=scratch)
+        wall_heights[:] = scratch
+        np.multiply(wall_heights, 0.5, out=scratch)
+        np.subtract(screen_half, scratch, out=scratch)
+        span_tops[:] = scratch
+        
+        # Clip each strip to the screen, then trim a row off both ends
+        np.add(span_tops, wall_heights, out=span_bottoms)
+        np.minimum(span_bottoms, self.screen_height, out=span_bottoms)
+        span_bottoms -= 1
+        np.maximum(span_tops, 0, out=span_tops)
+        span_tops += 1
+        
+        # Strips the wall kernel skips (degenerate or absurdly tall) hide nothing
+        np.logical_or(wall_heights <= 0, wall_heights >= 8000, out=self.span_skipped)
+        span_tops[self.span_skipped] = self.screen_height
+        span_bottoms[self.span_skipped] = 0
+        
+        # A low-res floor pixel can only be skipped if it is hidden in every
+        # screen column it is stretched over
+        np.take(self.span_tops, self.column_ray_index, out=self.column_span_tops)
+        np.take(self.span_bottoms, self.column_ray_index, out=self.column_span_bottoms)
+        np.maximum.reduceat(self.column_span_tops, self.floor_column_starts, out=self.floor_occluded_top)
+        np.minimum.reduceat(self.column_span_bottoms, self.floor_column_starts, out=self.floor_occluded_bottom)
+    
+    def _warm_up_kernels(self) -> None:
+        """Run the batched ray caster once on a tiny map during loading.
+        
+        The kernels are compiled (or loaded from cache) at import, but the first
+        parallel call still starts Numba's thread pool; doing that here keeps
+        the stall out of the first rendered frame.
+        """
+        # A single open tile inside its solid border
+        grid = np.ones((3, 3), dtype=np.uint8)
+        grid[1, 1] = 0
+        cast_rays_numba(
+            0.5, 0.5, 1.0, 0.0, grid, 1, 1, self.max_depth, self.num_rays,
+            self.ray_cos_offsets, self.ray_sin_offsets,
+            self.ray_distances, self.ray_wall_x, self.ray_flip, self.ray_hit_vals
+        )
+        
+    def _build_vignette_map(self) -> np.ndarray:
+        """Precompute the vignette brightness multiplier for every screen pixel.
+        
+        Returns:
+            float32 array of shape (screen_width, screen_height) in surfarray layout
+        """
+        radius = settings.lighting.vignette_radius
+        intensity = settings.lighting.vignette_intensity
+        denominator = 1.414 - radius + 0.001
+        
+        half_w = self.screen_width / 2.0
+        half_h = self.screen_height / 2.0
+        x_norm = (np.arange(self.screen_width) - half_w) / half_w
+        y_norm = (np.arange(self.screen_height) - half_h) / half_h
+        dist_squared = x_norm[:, None] ** 2 + y_norm[None, :] ** 2
+        
+        falloff = np.minimum(1.0, (np.sqrt(dist_squared) - radius) / denominator)
+        vignette = np.where(dist_squared > radius * radius, 1.0 - falloff * intensity, 1.0)
+        return vignette.astype(np.float32)
+    
     def render_floor_ceiling_vectorized(
         self, 
-        screen: pygame.Surface, 
         player: Player, 
         game_map: Map,
+        pixel_shifts: tuple[int, int, int],
         glitch_intensity: float = 0.0
     ) -> None:
-        """Render floor and ceiling using Numba-optimized operations.
+        """Render floor and ceiling into the frame buffer using Numba-optimized operations.
         
         Args:
-            screen: Surface to render to
             player: Player object
             game_map: Game map
+            pixel_shifts: Bit shifts of the red, green and blue channels in a screen pixel
             glitch_intensity: Glitch effect intensity (0.0 = off)
         """
-        floor_arrays = self.asset_manager.get_floor_arrays()
-        ceiling_arrays = self.asset_manager.get_ceiling_arrays()
-        
-        buffer_pixels = pygame.surfarray.pixels3d(self.floor_ceiling_buffer)
+        floor_arrays = self.asset_manager.get_packed_floor_textures()
+        ceiling_arrays = self.asset_manager.get_packed_ceiling_textures()
+        dir_x, dir_y = player.direction
         
         render_floor_ceiling_numba(
-            buffer_pixels,
+            self.floor_ceiling_buffer,
+            pixel_shifts,
             floor_arrays,
             ceiling_arrays,
             game_map.floor_grid_array,
@@ -91,58 +252,100 @@ class Raycaster:
             self.screen_height,
             player.x,
             player.y,
-            math.radians(player.rotation),
-            math.radians(self.fov),
+            dir_x,
+            dir_y,
+            self.fov_rad,
             player.bob_offset_y,
             settings.render.wall_height_factor,
             settings.lighting.enable_inverse_square,
             settings.lighting.light_intensity,
             settings.lighting.ambient_light,
             settings.lighting.enable_vignette,
-            settings.lighting.vignette_intensity,
-            settings.lighting.vignette_radius,
-            glitch_intensity  # Use dynamic glitch intensity
+            self.vignette_map,
+            glitch_intensity,  # Use dynamic glitch intensity
+            self.floor_occluded_top,
+            self.floor_occluded_bottom
         )
         
-        del buffer_pixels
+        if self.floor_scale > 1:
+            self._upscale_floor_ceiling()
+    
+    def _upscale_floor_ceiling(self) -> None:
+        """Nearest-neighbour upscale of the low-res floor/ceiling buffer into the frame buffer.
         
-        scaled_surf = pygame.transform.scale(
-            self.floor_ceiling_buffer, 
-            (self.screen_width, self.screen_height)
+        Uses a reshaped view so every source pixel is broadcast into its
+        floor_scale x floor_scale block without allocating an intermediate array.
+        """
+        scale = self.floor_scale
+        covered_w = self.floor_width * scale
+        covered_h = self.floor_height * scale
+        
+        blocks = self.frame_buffer[:covered_w, :covered_h].reshape(
+            self.floor_width, scale, self.floor_height, scale
         )
-        screen.blit(scaled_surf, (0, 0))
-                  
-    def render_3d_view_numba(self, screen: pygame.Surface, player: Player, game_map: Map, glitch_intensity: float = 0.0) -> None:
-        """Render the complete 3D view using Numba optimization.
+        blocks[:] = self.floor_ceiling_buffer[:, None, :, None]
+        
+        # Stretch the last column/row over any remainder pixels
+        if covered_w < self.screen_width:
+            self.frame_buffer[covered_w:, :covered_h] = self.frame_buffer[covered_w - 1:covered_w, :covered_h]
+        if covered_h < self.screen_height:
+            self.frame_buffer[:, covered_h:] = self.frame_buffer[:, covered_h - 1:covered_h]
+    
+
+    def _render_view_to_frame_buffer(
+        self,
+        player: Player,
+        game_map: Map,
+        pixel_shifts: tuple[int, int, int],
+        glitch_intensity: float
+    ) -> None:
+        """Cast all rays and draw floor, ceiling and walls into the frame buffer.
         
         Args:
-            screen: Surface to render to
             player: Player object
             game_map: Game map
+            pixel_shifts: Bit shifts of the red, green and blue channels in a screen pixel
             glitch_intensity: Glitch effect intensity (0.0 = off)
         """
-        # 1. Render floors and ceilings first (background)
-        self.render_floor_ceiling_vectorized(screen, player, game_map, glitch_intensity)
-        
-        screen_pixels = pygame.surfarray.pixels3d(screen)
-        
-        texture_arrays = self.asset_manager.get_wall_texture_arrays()
+        texture_arrays = self.asset_manager.get_packed_wall_textures()
         texture_map = self.asset_manager.get_texture_map()
         
-        # 2. Cast rays and render walls
-        render_walls_numba(
-            screen_pixels,
-            texture_arrays,
-            texture_map,
+        # 1. Cast every ray in one batch (the heading's trig is cached by the player)
+        dir_x, dir_y = player.direction
+        cast_rays_numba(
             player.x,
             player.y,
-            player.rotation,
-            game_map.grid_array,
+            dir_x,
+            dir_y,
+            game_map.padded_grid_array,
             game_map.width,
             game_map.height,
+            self.max_depth,
+            self.num_rays,
+            self.ray_cos_offsets,
+            self.ray_sin_offsets,
+            self.ray_distances,
+            self.ray_wall_x,
+            self.ray_flip,
+            self.ray_hit_vals
+        )
+        
+        # 2. Render floors and ceilings (background), skipping pixels walls will cover
+        self._update_wall_spans(player.bob_offset_y)
+        self.render_floor_ceiling_vectorized(player, game_map, pixel_shifts, glitch_intensity)
+        
+        # 3. Render walls from the ray results
+        render_walls_numba(
+            self.frame_buffer,
+            pixel_shifts,
+            texture_arrays,
+            texture_map,
+            self.ray_distances,
+            self.ray_wall_x,
+            self.ray_flip,
+            self.ray_hit_vals,
             self.screen_width,
             self.screen_height,
-            self.fov,
             self.max_depth,
             self.num_rays,
             self.ray_width,
@@ -152,15 +355,38 @@ class Raycaster:
             settings.lighting.light_intensity,
             settings.lighting.ambient_light,
             settings.lighting.enable_vignette,
-            settings.lighting.vignette_intensity,
-            settings.lighting.vignette_radius,
+            self.vignette_map,
             glitch_intensity,
             self.depth_buffer  # Pass pre-allocated depth buffer
         )
+
+    def render_3d_view_numba(self, screen: pygame.Surface, player: Player, game_map: Map, glitch_intensity: float = 0.0) -> None:
+        """Render the complete 3D view using Numba optimization.
+        
+        Args:
+            screen: Surface to render to
+            player: Player object
+            game_map: Game map
+            glitch_intensity: Glitch effect intensity (0.0 = off)
+        """
+        # Frame buffer pixels are packed in the screen's native channel order
+        pixel_shifts = screen.get_shifts()[:3]
+        
+        # The world view (floor, ceiling, walls and the depth buffer) only depends
+        # on these; while the player stands still, reuse the previous frame buffer.
+        # Sprites move on their own and are still drawn every frame.
+        view_state = (
+            player.x, player.y, player.rotation, player.bob_offset_y,
+            glitch_intensity, pixel_shifts, game_map
+        )
+        if view_state != self.last_view_state:
+            self._render_view_to_frame_buffer(player, game_map, pixel_shifts, glitch_intensity)
+            self.last_view_state = view_state
         
-        del screen_pixels
+        # Push the finished frame to the screen with a single copy
+        pygame.surfarray.blit_array(screen, self.frame_buffer)
         
-        # 3. Render dynamic objects (monsters, collectibles) with occlusion
+        # Render dynamic objects (monsters, collectibles) with occlusion
         self.render_sprites(screen, player, game_map, self.depth_buffer)
     
     def render(self, screen: pygame.Surface, player: Player, game_map: Map, glitch_intensity: float = 0.0) -> None:
@@ -239,6 +465,9 @@ class Raycaster:
             settings.collectible.texture_ids
         )
         
+        # Collect all sprite blits (already sorted far-to-near) and submit them in one call
+        blit_sequence: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        
         for i in range(processed_sprites.shape[0]):
             screen_x = int(processed_sprites[i, 0])
             sprite_height = int(processed_sprites[i, 1])
@@ -250,27 +479,38 @@ class Raycaster:
             draw_start_y = int((self.screen_height - sprite_height) / 2 + player.bob_offset_y)
             draw_start_x = int(screen_x - sprite_width / 2)
             
-            sprite_texture = self.asset_manager.get_sprite_texture(texture_id)
-            if sprite_texture is None:
-                continue
-            
             if sprite_width > 0 and sprite_height > 0:
                 # Quantize light factor to reduce cache size (steps of 0.05)
                 quantized_light = round(light_factor * 20) / 20
                 cache_key = (texture_id, sprite_width, sprite_height, quantized_light)
                 
-                if cache_key in self.darkened_sprite_cache:
-                    scaled_sprite = self.darkened_sprite_cache[cache_key]
+                scaled_sprite = self.darkened_sprite_cache.get(cache_key)
+                if scaled_sprite is not None:
+                    self.darkened_sprite_cache.move_to_end(cache_key)
                 else:
+                    # Only a cache miss needs the source texture and a freshly scaled
+                    # Surface; hits reuse the cached one, so no per-frame allocation
+                    sprite_texture = self.asset_manager.get_sprite_texture(
+                        texture_id, max(sprite_width, sprite_height)
+                    )
+                    if sprite_texture is None:
+                        continue
+                    
                     scaled_sprite = pygame.transform.scale(sprite_texture, (sprite_width, sprite_height))
                     
                     if quantized_light < 1.0:
-                        dark_surface = pygame.Surface(scaled_sprite.get_size(), pygame.SRCALPHA)
-                        dark_surface.fill((0, 0, 0, int(255 * (1.0 - quantized_light))))
-                        scaled_sprite.blit(dark_surface, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
+                        # Subtract in place instead of blitting a temporary overlay Surface
+                        scaled_sprite.fill(
+                            (0, 0, 0, int(255 * (1.0 - quantized_light))),
+                            special_flags=pygame.BLEND_RGBA_SUB
+                        )
                     
-                    # Add to cache if within size limit
-                    if len(self.darkened_sprite_cache) < self.max_cache_size:
-                        self.darkened_sprite_cache[cache_key] = scaled_sprite
+                    # Add to cache, evicting the least recently used entry when full
+                    self.darkened_sprite_cache[cache_key] = scaled_sprite
+                    if len(self.darkened_sprite_cache) > self.max_cache_size:
+                        self.darkened_sprite_cache.popitem(last=False)
                 
-                screen.blit(scaled_sprite, (draw_start_x, draw_start_y))
+                blit_sequence.append((scaled_sprite, (draw_start_x, draw_start_y)))
+        
+        if blit_sequence:
+            screen.blits(blit_sequence, doreturn=False)
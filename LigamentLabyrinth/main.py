@@ -13,6 +13,7 @@ if getattr(sys, 'frozen', False):
 
 import sys
 import math
+import time
 import pygame
 from pygame.locals import *
 
@@ -40,12 +41,21 @@ class Game:
         )
         pygame.display.set_caption(settings.display.title)
         
+        # The clock only measures frame times (for the FPS counter); pacing is
+        # done with perf_counter in wait_for_next_frame()
         self.clock: pygame.time.Clock = pygame.time.Clock()
         self.fps: int = settings.display.fps
         
+        self.frame_period: float = 1.0 / self.fps if self.fps > 0 else 0.0
+        self._next_frame_time: float = time.perf_counter()
+        self._prev_frame_time: float = self._next_frame_time
+        
         self.running: bool = True
         self.paused: bool = False
         
+        # While paused nothing in the world changes, so one presented frame is enough
+        self.frame_dirty: bool = True
+        
         self.show_fps: bool = settings.show_fps
         
         self.collectibles_obtained: int = 0
@@ -81,6 +91,10 @@ class Game:
         
         self.font: pygame.font.Font = pygame.font.Font(None, 36)
         
+        # Rendered FPS labels by value; the counter only cycles through a few
+        # hundred integers, so each label is rasterized once
+        self.fps_label_cache: dict[int, pygame.Surface] = {}
+        
         # Dynamic glitch intensity (updated each frame based on monster proximity)
         self.current_glitch_intensity: float = 0.0
 
@@ -91,8 +105,9 @@ class Game:
                 self.running = False
             elif event.type == KEYDOWN:
                 self.handle_keydown(event)
-            elif event.type == MOUSEMOTION:
-                self.handle_mouse_motion(event)
+            elif event.type in (VIDEOEXPOSE, WINDOWEXPOSED):
+                # The window contents may have been lost; redraw even if paused
+                self.frame_dirty = True
                 
     def handle_keydown(self, event: pygame.event.Event) -> None:
         """Handle individual key press events.
@@ -112,6 +127,7 @@ class Game:
             paused: True to pause logic; False to resume.
         """
         self.paused = paused
+        self.frame_dirty = True
         if self.paused:
             pygame.event.set_grab(False)
             pygame.mouse.set_visible(True)
@@ -129,17 +145,16 @@ class Game:
         pass
         
         
-    def handle_mouse_motion(self, event: pygame.event.Event) -> None:
-        """Handle mouse motion events.
+    def handle_mouse_look(self) -> None:
+        """Rotate the player by the mouse motion accumulated since the last frame.
         
-        Args:
-            event: The pygame mouse event
+        get_rel() returns the summed motion, so it is read once per frame
+        instead of once per queued MOUSEMOTION event.
         """
-        if not self.paused:
-            dx, dy = pygame.mouse.get_rel()
-            
-            if dx != 0:
-                self.player.rotate_from_mouse(dx)
+        dx, dy = pygame.mouse.get_rel()
+        
+        if dx != 0:
+            self.player.rotate_from_mouse(dx)
     
     def update(self, dt: float) -> None:
         """Update game logic including physics, AI, and collision.
@@ -148,6 +163,8 @@ class Game:
             dt: Delta time in seconds since the last frame.
         """
         if not self.paused:
+            self.handle_mouse_look()
+            
             keys = pygame.key.get_pressed()
             self.player.update(dt, keys, self.game_map)
             
@@ -173,8 +190,15 @@ class Game:
                 self.running = False
             
     def render(self) -> None:
-        """Clear the screen and render the 3D world, HUD, and UI elements."""
-        self.screen.fill(settings.colors.black)
+        """Render the 3D world, HUD, and UI elements.
+        
+        The raycaster overwrites every pixel of the frame, so no clear is needed.
+        While paused the world is frozen, so after one frame has been presented
+        the raycast and flip are skipped until something invalidates it.
+        """
+        if self.paused and not self.frame_dirty:
+            return
+        self.frame_dirty = False
         
         # Synchronization hack: ensure map has newest sprite locations
         self.game_map.sprite_data = self.entity_manager.sprite_data
@@ -185,20 +209,59 @@ class Game:
             self.minimap_renderer.render(self.screen, self.player, self.game_map)
         
         if self.show_fps:
-            fps_text = self.font.render(
-                f"FPS: {int(self.clock.get_fps())}", 
-                True, 
-                settings.colors.green
-            )
+            fps = int(self.clock.get_fps())
+            fps_text = self.fps_label_cache.get(fps)
+            if fps_text is None:
+                fps_text = self.font.render(f"FPS: {fps}", True, settings.colors.green)
+                self.fps_label_cache[fps] = fps_text
             self.screen.blit(fps_text, (10, 10))
         
         pygame.display.flip()
         
+    def wait_for_next_frame(self) -> float:
+        """Sleep until the next frame deadline and return the elapsed frame time.
+        
+        SDL_Delay-based sleeping has coarse granularity on many platforms, so
+        the bulk of the wait uses time.sleep and the final millisecond is
+        spun on time.perf_counter for sub-millisecond frame pacing.
+        
+        Returns:
+            Delta time in seconds since the previous frame.
+        """
+        if self.frame_period > 0.0:
+            self._next_frame_time += self.frame_period
+            
+            # If we fell more than a frame behind, resync instead of bursting
+            now = time.perf_counter()
+            if self._next_frame_time < now - self.frame_period:
+                self._next_frame_time = now
+            
+            sleep_for = self._next_frame_time - now
+            if sleep_for > 0.002:
+                time.sleep(sleep_for - 0.001)
+            while time.perf_counter() < self._next_frame_time:
+                pass
+        
+        now = time.perf_counter()
+        dt = now - self._prev_frame_time
+        self._prev_frame_time = now
+        
+        self.clock.tick()
+        return dt
+    
     def run(self) -> None:
-        """Main game loop."""
+        """Main game loop.
+        
+        The frame-cap sleep happens first and input is polled right after it,
+        so no sleep sits between sampling input and simulating/presenting it.
+        """
+        # Start pacing from now so asset loading does not count as frame time
+        self._next_frame_time = self._prev_frame_time = time.perf_counter()
+        
         while self.running:
-            dt = self.clock.tick(self.fps) / 1000.0
+            dt = self.wait_for_next_frame()
             
+            # Poll input only after the sleep so update() sees the freshest state
             self.handle_events()
             self.update(dt)
             self.render()
@@ -45,6 +45,34 @@ class TestMap(unittest.TestCase):
         finally:
             os.unlink(temp_map)
 
+    def test_map_markers(self):
+        """Test that entity markers are recorded and become empty floor."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write("1111\n")
+            f.write("1pM1\n")
+            f.write("1c2\n")
+            temp_map = f.name
+        
+        try:
+            game_map, monsters, collectibles = Map.load_from_file(temp_map)
+            
+            self.assertEqual(game_map.player_start, (1.5, 1.5))
+            self.assertEqual(monsters, [{'x': 2.5, 'y': 1.5}])
+            self.assertEqual(collectibles, [{'x': 1.5, 'y': 2.5}])
+            self.assertEqual(game_map.grid, [[1, 1, 1, 1], [1, 0, 0, 1], [1, 0, 2, 1]])
+        finally:
+            os.unlink(temp_map)
+
+    def test_is_wall_bounds(self):
+        """Test that is_wall treats everything outside the grid as solid."""
+        game_map = Map([[0, 0], [0, 1]], (0.5, 0.5))
+        
+        self.assertFalse(game_map.is_wall(0.5, 0.5))
+        self.assertFalse(game_map.is_wall(1.5, 0.5))
+        self.assertTrue(game_map.is_wall(1.5, 1.5))
+        for x, y in [(-1.5, 0.5), (0.5, -1.5), (2.5, 0.5), (0.5, 2.5), (-5.0, 9.0), (40.0, 0.5)]:
+            self.assertTrue(game_map.is_wall(x, y), (x, y))
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -62,6 +62,20 @@ class TestPlayer(unittest.TestCase):
         self.player.update(0.1, mock_keys, empty_map)
         self.assertGreater(self.player.x, initial_x)
 
+    def test_diagonal_movement_keeps_speed(self):
+        empty_map = MockMap()
+        
+        # Mock pressing 'W' and 'A' together
+        diagonal = {mock_pg.locals.K_w, mock_pg.locals.K_a}
+        mock_keys = MagicMock()
+        mock_keys.__getitem__.side_effect = lambda k: 1 if k in diagonal else 0
+        
+        self.player.update(0.1, mock_keys, empty_map)
+        
+        from settings import settings
+        distance = math.hypot(self.player.x - 5.0, self.player.y - 5.0)
+        self.assertAlmostEqual(distance, settings.player.move_speed * 0.1)
+
     def test_movement_collision(self):
         wall_map = MockMap(walls={(6, 5)})
         
@@ -91,5 +105,18 @@ class TestPlayer(unittest.TestCase):
         
         self.assertAlmostEqual(self.player._cos_cache, expected_cos, places=5)
 
+    def test_rotation_wraps_into_range(self):
+        self.player.rotation = 350.0
+        self.player.rotate(20.0)
+        self.assertAlmostEqual(self.player.rotation, 10.0)
+        
+        self.player.rotate(-30.0)
+        self.assertAlmostEqual(self.player.rotation, 340.0)
+        
+        # Large jumps still land in [0, 360)
+        self.player.rotate(1000.0)
+        self.assertGreaterEqual(self.player.rotation, 0.0)
+        self.assertLess(self.player.rotation, 360.0)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
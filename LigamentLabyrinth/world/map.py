@@ -1,7 +1,16 @@
 """Tile-based map geometry."""
+import re
 import sys
 import numpy as np
 
+# Byte translation table for map rows: digits become their tile ID and every
+# other character (markers, blanks) becomes empty floor
+_TILE_TABLE = bytes(c - 48 if 48 <= c <= 57 else 0 for c in range(256))
+# Characters dropped from texture map rows, which only keep their digits
+_NON_DIGITS = bytes(c for c in range(256) if not 48 <= c <= 57)
+# Entity markers placed on top of empty floor
+_MARKER_PATTERN = re.compile(rb'[PpMmCc]')
+
 class Map:
     """Represents the static geometry of the level (Walls, Floors, Ceilings).
     
@@ -24,15 +33,31 @@ class Map:
         self.player_start = player_start
         
         # Geometry Arrays for Numba
-        self.grid_array = np.array(grid, dtype=np.int32)
+        # Tile IDs are single digits, so one byte per cell keeps the whole wall
+        # grid resident in L1 cache while the DDA walks it. The one-tile border of
+        # wall 1 lets the DDA stop at the map edge without bounds checks; cell
+        # (x, y) lives at padded_grid_array[y + 1, x + 1].
+        self.padded_grid_array = np.pad(
+            np.asarray(grid, dtype=np.uint8), 1, constant_values=1
+        )
+        
+        # Wall flags surrounded by a one-tile solid border, so is_wall only
+        # needs an index offset instead of a bounds check per axis.
+        # Kept as nested lists: scalar indexing a NumPy array from Python is
+        # slower than a list lookup.
+        border_row = [True] * (self.width + 2)
+        self.wall_mask = [border_row] + [
+            [True] + [tile > 0 for tile in row] + [True] for row in grid
+        ] + [border_row]
         
         if floor_grid is None:
             floor_grid = [[0] * self.width for _ in range(self.height)]
         if ceiling_grid is None:
             ceiling_grid = [[0] * self.width for _ in range(self.height)]
-            
-        self.floor_grid_array = np.array(floor_grid, dtype=np.int32)
-        self.ceiling_grid_array = np.array(ceiling_grid, dtype=np.int32)
+        
+        # Single-digit texture IDs too, so a byte per cell like the wall grid
+        self.floor_grid_array = np.array(floor_grid, dtype=np.uint8)
+        self.ceiling_grid_array = np.array(ceiling_grid, dtype=np.uint8)
 
     def is_wall(self, x: float, y: float) -> bool:
         """Check if the given world coordinates are occupied by a wall.
@@ -44,12 +69,14 @@ class Map:
         Returns:
             True if the tile is a wall, False otherwise.
         """
-        # Casting to int acts as floor()
-        map_x, map_y = int(x), int(y)
-        
-        if map_x < 0 or map_x >= self.width or map_y < 0 or map_y >= self.height:
+        # Anything left of the border would wrap around as a negative index
+        if x < -1.0 or y < -1.0:
+            return True
+        # Casting to int acts as floor(); +1 skips the border row/column
+        try:
+            return self.wall_mask[int(y) + 1][int(x) + 1]
+        except IndexError:
             return True
-        return self.grid[map_y][map_x] > 0
 
     @staticmethod
     def load_from_file(filename: str) -> tuple['Map', list[dict], list[dict]]:
@@ -69,24 +96,22 @@ class Map:
         found_collectibles = []
         
         try:
-            with open(filename, 'r') as file:
+            with open(filename, 'rb') as file:
                 for y, line in enumerate(file):
-                    row = []
-                    for x, char in enumerate(line.strip()):
-                        if char.isdigit():
-                            row.append(int(char))
-                        elif char.upper() == 'P':
+                    line = line.strip()
+                    # Map whole rows at C speed; markers are rare, so only
+                    # they are visited individually
+                    row = list(line.translate(_TILE_TABLE))
+                    for match in _MARKER_PATTERN.finditer(line):
+                        x = match.start()
+                        marker = match.group().upper()
+                        if marker == b'P':
                             player_start = (float(x) + 0.5, float(y) + 0.5)
-                            row.append(0)
-                        elif char.upper() == 'M':
+                        elif marker == b'M':
                             # Store the data, don't create the object yet
                             found_monsters.append({'x': x + 0.5, 'y': y + 0.5})
-                            row.append(0)
-                        elif char.upper() == 'C':
-                            found_collectibles.append({'x': x + 0.5, 'y': y + 0.5})
-                            row.append(0)
                         else:
-                            row.append(0)
+                            found_collectibles.append({'x': x + 0.5, 'y': y + 0.5})
                     if row:
                         grid.append(row)
 
@@ -94,8 +119,7 @@ class Map:
             if grid:
                 max_width = max(len(row) for row in grid)
                 for row in grid:
-                    while len(row) < max_width:
-                        row.append(1)
+                    row.extend([1] * (max_width - len(row)))
 
             # Load extra textures
             f_grid = Map._load_texture_map(filename.replace('.txt', '_floor.txt'), max_width, len(grid))
@@ -122,9 +146,9 @@ class Map:
         """
         try:
             grid = []
-            with open(filename, 'r') as f:
+            with open(filename, 'rb') as f:
                 for line in f:
-                    row = [int(c) for c in line.strip() if c.isdigit()]
+                    row = list(line.translate(_TILE_TABLE, _NON_DIGITS))
                     if row: grid.append(row)
             return grid
         except FileNotFoundError:
@@ -5,6 +5,11 @@ from typing import TYPE_CHECKING
 
 from settings import settings
 
+# Same factor math.radians uses, applied as a plain multiply
+DEG_TO_RAD = math.pi / 180.0
+# Scale that brings a diagonal (forward + strafe) step back to the move speed
+INV_SQRT2 = 1.0 / math.sqrt(2.0)
+
 if TYPE_CHECKING:
     from world.map import Map
 
@@ -12,6 +17,13 @@ if TYPE_CHECKING:
 class Player:
     """Represents the player with position, rotation, and movement capabilities."""
     
+    # Fixed attribute layout: the player's fields are read many times per frame
+    __slots__ = (
+        'x', 'y', 'rotation',
+        'bob_phase', 'bob_offset_y', 'is_moving', 'is_sprinting',
+        'collision_radius', '_cos_cache', '_sin_cache'
+    )
+    
     def __init__(self, x: float, y: float, rotation: float = 0.0) -> None:
         """Initialize the player.
         
@@ -29,23 +41,15 @@ class Player:
         self.is_moving: bool = False
         self.is_sprinting: bool = False
         
-        radius = settings.player.collision_radius
-        self.collision_offsets: list[tuple[float, float]] = [
-            (radius, 0),
-            (-radius, 0),
-            (0, radius),
-            (0, -radius),
-            (radius * 0.707, radius * 0.707),
-            (-radius * 0.707, radius * 0.707),
-            (radius * 0.707, -radius * 0.707),
-            (-radius * 0.707, -radius * 0.707)
-        ]
-        
-        self._cos_cache: float = math.cos(math.radians(rotation))
-        self._sin_cache: float = math.sin(math.radians(rotation))
+        self.collision_radius: float = settings.player.collision_radius
+        
+        self._update_trig_cache()
     
     def _check_collision(self, x: float, y: float, game_map: 'Map') -> bool:
-        """Check if position collides with walls using multiple points.
+        """Check if the player's bounding box at a position overlaps a wall.
+        
+        The radius is below half a tile, so the box can touch at most the 2x2
+        tiles under its corners; checking the corners covers all of them.
         
         Args:
             x: X coordinate to check
@@ -55,14 +59,11 @@ class Player:
         Returns:
             True if collision detected, False otherwise
         """
-        if game_map.is_wall(x, y):
-            return True
-        
-        for offset_x, offset_y in self.collision_offsets:
-            if game_map.is_wall(x + offset_x, y + offset_y):
-                return True
-        
-        return False
+        r = self.collision_radius
+        left, right = x - r, x + r
+        top, bottom = y - r, y + r
+        return (game_map.is_wall(left, top) or game_map.is_wall(right, top) or
+                game_map.is_wall(left, bottom) or game_map.is_wall(right, bottom))
     
     def _move_with_collision(self, dx: float, dy: float, game_map: 'Map') -> None:
         """Move player with collision detection and wall sliding.
@@ -105,11 +106,19 @@ class Player:
         self.rotation = float(rotation)
         self._update_trig_cache()
         
+    @property
+    def direction(self) -> tuple[float, float]:
+        """Unit vector the player is facing, as (cos, sin) of the rotation.
+        
+        Served from the trig cache, so renderers don't redo the trig each frame.
+        """
+        return self._cos_cache, self._sin_cache
+        
     def _update_trig_cache(self) -> None:
         """Cache trigonometric calculations for performance."""
-        rad = math.radians(self.rotation)
-        self._cos_cache = math.cos(rad)
-        self._sin_cache = math.sin(rad)
+        rad = self.rotation * DEG_TO_RAD
+        self._cos_cache: float = math.cos(rad)
+        self._sin_cache: float = math.sin(rad)
         
     def rotate(self, degrees: float) -> None:
         """Rotate player by degrees.
@@ -117,7 +126,22 @@ class Player:
         Args:
             degrees: Rotation amount in degrees
         """
-        self.rotation = (self.rotation + float(degrees)) % 360.0
+        # A zero delta leaves the heading, and so the trig cache, as it is
+        if not degrees:
+            return
+        
+        rotation = self.rotation + float(degrees)
+        
+        # Per-frame deltas are small, so a single add/subtract normally wraps the
+        # angle; only fall back to the float modulo for large jumps
+        if rotation >= 360.0:
+            rotation -= 360.0
+        elif rotation < 0.0:
+            rotation += 360.0
+        if rotation >= 360.0 or rotation < 0.0:
+            rotation %= 360.0
+        
+        self.rotation = rotation
         self._update_trig_cache()
         
     def rotate_from_mouse(self, dx: float) -> None:
@@ -162,9 +186,6 @@ class Player:
             keys_pressed: Dictionary/sequence of pressed keys from pygame
             game_map: The game map for collision detection
         """
-        total_dx = 0.0
-        total_dy = 0.0
-        
         from pygame.locals import K_LSHIFT, K_RSHIFT, K_w, K_s, K_a, K_d
         
         is_sprinting = keys_pressed[K_LSHIFT] or keys_pressed[K_RSHIFT]
@@ -174,32 +195,31 @@ class Player:
         if is_sprinting:
             move_speed *= settings.player.sprint_multiplier
         
-        if keys_pressed[K_w]:
-            total_dx += self._cos_cache * move_speed
-            total_dy += self._sin_cache * move_speed
-            
-        if keys_pressed[K_s]:
-            total_dx += -self._cos_cache * move_speed
-            total_dy += -self._sin_cache * move_speed
-            
-        if keys_pressed[K_a]:
-            total_dx += self._sin_cache * move_speed
-            total_dy += -self._cos_cache * move_speed
-            
-        if keys_pressed[K_d]:
-            total_dx += -self._sin_cache * move_speed
-            total_dy += self._cos_cache * move_speed
+        # Read each movement key once; opposing keys cancel to -1, 0 or +1
+        key_w = keys_pressed[K_w]
+        key_s = keys_pressed[K_s]
+        key_a = keys_pressed[K_a]
+        key_d = keys_pressed[K_d]
+        forward = key_w - key_s
+        strafe = key_a - key_d
+        
+        # Forward vector scaled to this frame's step, read once
+        step_cos = self._cos_cache * move_speed
+        step_sin = self._sin_cache * move_speed
+        
+        total_dx = forward * step_cos + strafe * step_sin
+        total_dy = forward * step_sin - strafe * step_cos
 
-        self.is_moving = (keys_pressed[K_w] or keys_pressed[K_s] or keys_pressed[K_a] or keys_pressed[K_d])
+        self.is_moving = bool(key_w or key_s or key_a or key_d)
 
-        if self.is_moving:
-            current_speed = math.sqrt(total_dx**2 + total_dy**2)
-            if current_speed > move_speed:
-                scale = move_speed / current_speed
-                total_dx *= scale
-                total_dy *= scale
-
-        if total_dx != 0 or total_dy != 0:
+        # Opposing keys that cancel out leave nothing to move or normalize
+        if forward or strafe:
+            # Only two speeds are possible: a single axis is already unit length,
+            # a diagonal is sqrt(2) too long
+            if forward and strafe:
+                total_dx *= INV_SQRT2
+                total_dy *= INV_SQRT2
+            
             self._move_with_collision(total_dx, total_dy, game_map)
         
         self.update_bobbing(dt)